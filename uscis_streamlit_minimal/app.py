@@ -6,23 +6,58 @@ Run with: streamlit run app.py
 """
 
 import streamlit as st
+import pandas as pd
 import json
 import time
+import threading
+from collections import deque, namedtuple
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import cycle, islice
 from datetime import datetime
 from typing import Optional
-import sys
-import os
-
-# Add services to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from services.uscis_client import (
-    USCISApiClient, 
-    USCISEnvironment, 
-    USCISApiError,
-    CaseStatus,
-    FOIARequest
-)
+
+
+@st.cache_resource
+def _uscis_module():
+    """Import the USCIS client module (and requests) on first use, once per process"""
+    import services.uscis_client as uscis_client
+    return uscis_client
+
+
+@st.cache_resource(ttl=1800, show_spinner=False, on_release=lambda client: client.close())
+def _get_client(client_id: str, client_secret: str, environment: str, demo_id: Optional[str]):
+    """
+    Build and authenticate a USCIS client shared across reruns
+    
+    Cached by all four arguments, so a rotated secret builds a new client
+    (Streamlit keys the cache on a hash of the arguments, not the values).
+    Entries expire with the default token lifetime so reconnects reuse one
+    session and its connection pool; evicted clients are closed so their
+    sockets and refresh thread don't leak.
+    """
+    uscis = _uscis_module()
+    client = uscis.USCISApiClient(
+        client_id, client_secret, uscis.USCISEnvironment(environment), demo_id=demo_id
+    )
+    client.authenticate()
+    return client
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_case_status(receipt: str, environment: str, _client):
+    """
+    Case status lookup memoized for 5 minutes per (receipt, environment)
+    
+    Only for interactive lookups - traffic and demo runs must hit the API.
+    Errors are raised rather than cached.
+    
+    Returns:
+        (CaseStatus, time.monotonic() of the API call); a timestamp from before
+        the caller's request means the result was served from this cache
+    """
+    # This cache is the only one in play, so every miss is a real API call
+    return _client.get_case_status(receipt, use_cache=False), time.monotonic()
 
 # Page config
 st.set_page_config(
@@ -37,8 +72,19 @@ st.set_page_config(
 # ============================================
 DEMO_ID = "3401"  # USCIS assigned demo ID for production access
 
-# Custom CSS
-st.markdown("""
+# Sandbox receipts that return 200, and malformed inputs that return 4xx
+VALID_RECEIPTS = ("EAC9999103402", "WAC9999103402", "LIN9999103402")
+ERROR_RECEIPTS = ("INVALID", "XXX000", "ABC", "123", "!@#")
+
+# (input, description) pairs exercised by the demo's 4xx step
+DEMO_ERROR_CASES = (
+    ("INVALID", "Invalid format"),
+    ("XXX0000000000", "Invalid prefix"),
+    ("ABC", "Too short"),
+)
+
+# Custom CSS (static, so it lives at module scope instead of being rebuilt per rerun)
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -79,7 +125,50 @@ st.markdown("""
         border-radius: 3px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+# Demo tab boxes (formatted with DEMO_ID once; only {timestamp} is filled in per rerun)
+DEMO_BOX_TEMPLATE = f"""
+    <div class="demo-box">
+        <h3>📋 Demo Configuration</h3>
+        <p><strong>Demo ID:</strong> {DEMO_ID}</p>
+        <p><strong>Environment:</strong> Sandbox (api-int.uscis.gov)</p>
+        <p><strong>Timestamp:</strong> {{timestamp}}</p>
+    </div>
+    """
+
+HEADER_BOX_HTML = f"""
+    <div class="header-box">
+Content-Type: application/json<br>
+Accept: application/json<br>
+<span style="color: #ffff00; font-weight: bold;">demo_id: {DEMO_ID}</span>  ← USCIS REQUIRED HEADER<br>
+Authorization: Bearer &lt;token&gt;
+    </div>
+    """
+
+
+# Emitted on every full run on purpose: Streamlit drops elements a run doesn't
+# re-emit, so memoizing this call would strip the styles after the first rerun.
+# Fragment reruns don't reach this line, and the string is a module constant.
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+@dataclass(slots=True)
+class TrafficStats:
+    """Session counts of 200 (ok) and 4xx (err) responses"""
+    ok: int = 0
+    err: int = 0
+    
+    @property
+    def total(self) -> int:
+        return self.ok + self.err
+    
+    def record(self, ok: bool):
+        if ok:
+            self.ok += 1
+        else:
+            self.err += 1
 
 
 # Initialize session state
@@ -88,11 +177,15 @@ if 'client' not in st.session_state:
 if 'demo_client' not in st.session_state:
     st.session_state.demo_client = None
 if 'api_logs' not in st.session_state:
-    st.session_state.api_logs = []
+    st.session_state.api_logs = deque(maxlen=100)
 if 'traffic_stats' not in st.session_state:
-    st.session_state.traffic_stats = {"200": 0, "4xx": 0, "total": 0}
+    st.session_state.traffic_stats = TrafficStats()
+if 'auth_last_attempt' not in st.session_state:
+    # monotonic() has an arbitrary zero point, so "never" must compare as long ago
+    st.session_state.auth_last_attempt = float("-inf")
 
-# Load credentials from Streamlit secrets
+# Load credentials from Streamlit secrets. Read on every run (st.secrets is
+# already in memory) so edits to secrets.toml take effect without a restart.
 def get_secret(key: str, default: str = "") -> str:
     try:
         return st.secrets.get(key, default)
@@ -102,58 +195,236 @@ def get_secret(key: str, default: str = "") -> str:
 DEFAULT_CLIENT_ID = get_secret("USCIS_CLIENT_ID", "")
 DEFAULT_CLIENT_SECRET = get_secret("USCIS_CLIENT_SECRET", "")
 DEFAULT_ENVIRONMENT = get_secret("USCIS_ENVIRONMENT", "sandbox")
+IS_SANDBOX = DEFAULT_ENVIRONMENT.lower() != "production"
+
+
+def _is_4xx(status) -> bool:
+    """True for 4xx HTTP statuses; status is None for network errors"""
+    return isinstance(status, int) and 400 <= status < 500
+
+
+# Compact, immutable log record (no per-entry dict); details are stored as
+# the JSON string rendered by the log tab, serialized once at log time
+LogEntry = namedtuple("LogEntry", "ts action status details_json")
 
 
 def add_log(action: str, status: str, details: dict = None):
-    st.session_state.api_logs.insert(0, {
-        "timestamp": datetime.now().isoformat(),
-        "action": action,
-        "status": status,
-        "details": details or {}
-    })
-    st.session_state.api_logs = st.session_state.api_logs[:100]
+    # Bounded ring buffer: appendleft is O(1) and drops the oldest entry
+    st.session_state.api_logs.appendleft(
+        LogEntry(
+            datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), action, status,
+            json.dumps(details or {}, default=str)
+        )
+    )
 
 
-# ==================== SIDEBAR ====================
+# ==================== CONCURRENT TRAFFIC ====================
 
-with st.sidebar:
-    st.markdown("### 🔐 Connection Status")
+# Worker threads used to overlap case status round-trips
+MAX_WORKERS = 8
+
+# USCIS sandbox rate limit; concurrent traffic never starts requests faster
+MAX_REQUESTS_PER_SECOND = 10
+
+# Minimum seconds between progress repaints during bulk runs (~10 Hz)
+UI_FLUSH_INTERVAL = 0.1
+
+# Minimum seconds between automatic authentication attempts
+AUTH_RETRY_COOLDOWN = 30
+
+
+class RateLimiter:
+    """Thread-safe gate that spaces request starts at least min_interval seconds apart"""
     
-    # Auto-connect on startup
-    if not st.session_state.client and DEFAULT_CLIENT_ID and DEFAULT_CLIENT_SECRET:
-        try:
-            env = USCISEnvironment.PRODUCTION if DEFAULT_ENVIRONMENT.lower() == "production" else USCISEnvironment.SANDBOX
-            client = USCISApiClient(DEFAULT_CLIENT_ID, DEFAULT_CLIENT_SECRET, env, demo_id=DEMO_ID)
-            client.authenticate()
-            st.session_state.client = client
-            add_log("Auto-Authentication", "SUCCESS", {"environment": env.value, "demo_id": DEMO_ID})
-        except USCISApiError as e:
-            add_log("Auto-Authentication", "FAILED", {"error": str(e)})
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def iter_case_statuses(client, receipts, min_interval: float = 0.0):
+    """
+    Fetch case statuses concurrently, yielding results as they complete
     
+    Requests run on a thread pool so network round-trips overlap, while the
+    rate limiter keeps request starts spaced to honor USCIS rate limits
+    (never more than MAX_REQUESTS_PER_SECOND, whatever min_interval is).
+    Streamlit calls must stay on the script thread, so callers update the UI
+    from the yielded results.
+    
+    Yields:
+        (index, receipt, CaseStatus or None, USCISApiError or None) tuples,
+        where index is the receipt's position in the input
+    """
+    uscis = _uscis_module()
+    limiter = RateLimiter(max(min_interval, 1 / MAX_REQUESTS_PER_SECOND))
+    abandoned = threading.Event()
+    
+    def fetch(receipt: str):
+        limiter.wait()
+        if abandoned.is_set():
+            return None
+        # Traffic runs exist to generate API calls, so bypass the client's cache
+        # Malformed inputs must reach the API too: the 4xx responses are the point
+        return client.get_case_status(receipt, use_cache=False, validate=False)
+    
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {
+            executor.submit(fetch, receipt): (index, receipt)
+            for index, receipt in enumerate(receipts)
+        }
+        for future in as_completed(futures):
+            try:
+                status, error = future.result(), None
+            except uscis.USCISApiError as e:
+                status, error = None, e
+            yield (*futures[future], status, error)
+    finally:
+        # If the run is abandoned (Stop, a widget click, or a UI call raising
+        # closes this generator), drop the queued fetches and let workers still
+        # waiting on the rate limiter skip their request, instead of blocking
+        # the script thread until the whole queue drains
+        abandoned.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_test_batch(client, receipts, expect_error: bool, min_interval: float = 0.5):
+    """
+    Run a batch of case status tests, reporting each result as it completes
+    
+    Successful responses count toward the 200 stat; errors count toward the
+    4xx stat when expect_error is set and the status is actually 4xx.
+    
+    Returns:
+        (results, messages): results is a list of (CaseStatus or None,
+        USCISApiError or None) in input order; messages is the (level, text)
+        list shown while running, for replaying with show_messages
+    """
+    results = [None] * len(receipts)
+    messages = []
+    for i, receipt, status, e in iter_case_statuses(client, receipts, min_interval):
+        results[i] = (status, e)
+        if e is None:
+            st.session_state.traffic_stats.record(ok=True)
+            if expect_error:
+                message = ("warning", f"⚠️ {receipt} - 200 (expected 4xx)")
+            else:
+                message = ("success", f"✅ {receipt} - 200 OK")
+        elif expect_error and _is_4xx(e.status):
+            st.session_state.traffic_stats.record(ok=False)
+            message = ("success", f"✅ {receipt} - {e.status} (expected)")
+        else:
+            message = ("error", f"❌ {receipt} - {e.status}")
+        show_messages([message])
+        messages.append(message)
+    return results, messages
+
+
+def show_messages(messages):
+    """Draw (level, text) pairs as st.success / st.warning / st.error alerts"""
+    for level, text in messages:
+        getattr(st, level)(text)
+
+
+# ==================== SIDEBAR ====================
+
+# Sidebar token countdown refresh: fast only when expiry is close
+TOKEN_POLL_FAST = 30
+TOKEN_POLL_SLOW = 300
+TOKEN_NEAR_EXPIRY = 600
+
+
+def _token_poll_interval() -> int:
+    # Read the token directly; get_token_info() builds a whole display dict
+    token_info = st.session_state.client.token_info if st.session_state.client else None
+    if token_info and 0 < token_info.seconds_remaining < TOKEN_NEAR_EXPIRY:
+        return TOKEN_POLL_FAST
+    return TOKEN_POLL_SLOW
+
+
+def _render_connection_status(poll_interval: int):
+    """Token status; run as a fragment that refreshes itself every poll_interval seconds"""
     if st.session_state.client:
         token_info = st.session_state.client.get_token_info()
         if token_info.get("authenticated"):
             seconds_remaining = token_info.get("seconds_remaining", 0)
+            if poll_interval > TOKEN_POLL_FAST and 0 < seconds_remaining < TOKEN_NEAR_EXPIRY:
+                # Crossed into the near-expiry window: full rerun switches to fast polling
+                st.rerun()
             if seconds_remaining > 0:
-                st.success("🟢 Connected")
-                st.metric("Token Expires", f"{seconds_remaining}s")
-                st.caption(f"Environment: **{token_info.get('environment', 'unknown').upper()}**")
-                st.caption(f"Demo ID: **{DEMO_ID}**")
+                # One HTML element instead of four separate status widgets
+                st.markdown(f"""
+                <div class="success-row">
+                    <strong>🟢 Connected</strong><br>
+                    Token expires in <strong>{seconds_remaining}s</strong><br>
+                    Environment: <strong>{token_info.get('environment', 'unknown').upper()}</strong><br>
+                    Demo ID: <strong>{DEMO_ID}</strong>
+                </div>
+                """, unsafe_allow_html=True)
             else:
                 st.error("🔴 Token Expired")
                 if st.button("🔄 Reconnect"):
+                    st.session_state.auth_last_attempt = float("-inf")
                     st.session_state.client.authenticate()
                     st.rerun()
     else:
         st.warning("🟡 Not connected")
+        if DEFAULT_CLIENT_ID and DEFAULT_CLIENT_SECRET and st.button("🔄 Retry Connection"):
+            # Explicit retry skips the auto-connect cooldown
+            st.session_state.auth_last_attempt = float("-inf")
+            st.rerun()
+
+
+with st.sidebar:
+    st.markdown("### 🔐 Connection Status")
+    
+    env = "sandbox" if IS_SANDBOX else "production"
+    
+    # Edited credentials (e.g. a rotated secret) replace the session's client
+    client = st.session_state.client
+    if client and (client.client_id, client.client_secret, client.environment.value) != (
+        DEFAULT_CLIENT_ID, DEFAULT_CLIENT_SECRET, env
+    ):
+        st.session_state.client = None
+        st.session_state.auth_last_attempt = float("-inf")
+    
+    # Auto-connect on startup, at most once per AUTH_RETRY_COOLDOWN so a failing
+    # OAuth call isn't repeated on every widget interaction
+    if (
+        not st.session_state.client
+        and DEFAULT_CLIENT_ID and DEFAULT_CLIENT_SECRET
+        and time.monotonic() - st.session_state.auth_last_attempt > AUTH_RETRY_COOLDOWN
+    ):
+        st.session_state.auth_last_attempt = time.monotonic()
+        uscis = _uscis_module()
+        try:
+            st.session_state.client = _get_client(DEFAULT_CLIENT_ID, DEFAULT_CLIENT_SECRET, env, DEMO_ID)
+            add_log("Auto-Authentication", "SUCCESS", {"environment": env, "demo_id": DEMO_ID})
+        except uscis.USCISApiError as e:
+            add_log("Auto-Authentication", "FAILED", {"error": str(e)})
+    
+    poll_interval = _token_poll_interval()
+    st.fragment(_render_connection_status, run_every=poll_interval)(poll_interval)
     
     st.markdown("---")
     st.markdown("### 📊 Session Stats")
-    col1, col2 = st.columns(2)
+    stats = st.session_state.traffic_stats
+    col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("✅ 200", st.session_state.traffic_stats["200"])
+        st.metric("✅ 200", stats.ok)
     with col2:
-        st.metric("❌ 4xx", st.session_state.traffic_stats["4xx"])
+        st.metric("❌ 4xx", stats.err)
+    with col3:
+        st.metric("Total", stats.total)
     
     st.markdown("---")
     st.markdown("### ⏰ Sandbox Hours")
@@ -165,7 +436,7 @@ with st.sidebar:
 st.markdown('<p class="main-header">🏛️ USCIS Torch API Console</p>', unsafe_allow_html=True)
 st.markdown(f'<p class="sub-header">Demo ID: {DEMO_ID} | Production Access Testing</p>', unsafe_allow_html=True)
 
-# Tabs
+# Tabs - each body is an st.fragment so widget interactions only rerun that tab
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "📋 Case Status", 
     "🎯 USCIS Demo",
@@ -177,77 +448,211 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
 
 # ==================== TAB 1: CASE STATUS ====================
 
-with tab1:
+def _set_receipt_input(receipt: str):
+    st.session_state.receipt_input = receipt
+
+
+def _render_case_result(status, error: Optional[str], cached: bool):
+    if error:
+        st.error(f"❌ {error}")
+        return
+    st.success("✅ HTTP 200 OK (cached, no API call)" if cached else "✅ HTTP 200 OK")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Receipt", status.receipt_number)
+        st.metric("Form", status.form_type)
+    with col2:
+        st.metric("Submitted", status.submitted_date or "N/A")
+        st.metric("Modified", status.modified_date or "N/A")
+    
+    st.info(f"**{status.status_text_en}**")
+
+
+@st.fragment
+def _render_case_status_tab():
     st.markdown("## Case Status API")
     
-    receipt_input = st.text_input("Receipt Number", placeholder="e.g., EAC9999103402")
+    receipt_input = st.text_input("Receipt Number", placeholder="e.g., EAC9999103402", key="receipt_input")
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        if st.button("EAC9999103402"):
-            receipt_input = "EAC9999103402"
-    with col2:
-        if st.button("WAC9999103402"):
-            receipt_input = "WAC9999103402"
-    with col3:
-        if st.button("LIN9999103402"):
-            receipt_input = "LIN9999103402"
+    # Example buttons fill the input through a callback, which runs before the
+    # text input is instantiated on the next rerun
+    for col, receipt in zip(st.columns(len(VALID_RECEIPTS)), VALID_RECEIPTS):
+        with col:
+            st.button(receipt, on_click=_set_receipt_input, args=(receipt,))
     
     if st.button("🔍 Check Status", type="primary", disabled=not st.session_state.client):
         if receipt_input:
+            uscis = _uscis_module()
             with st.spinner("Querying USCIS..."):
                 try:
-                    status = st.session_state.client.get_case_status(receipt_input)
-                    st.session_state.traffic_stats["200"] += 1
-                    st.session_state.traffic_stats["total"] += 1
-                    add_log(f"Case: {receipt_input}", "SUCCESS", {"http": 200})
+                    client = st.session_state.client
+                    requested_at = time.monotonic()
+                    status, fetched_at = _cached_case_status(receipt_input, client.environment.value, client)
+                    # A cache hit sent nothing to USCIS, so it isn't counted as traffic
+                    sent = fetched_at >= requested_at
+                    if sent:
+                        st.session_state.traffic_stats.record(ok=True)
+                        add_log(f"Case: {receipt_input}", "SUCCESS", {"http": 200})
+                    st.session_state.case_result = (status, None, not sent)
                     
-                    st.success(f"✅ HTTP 200 OK")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Receipt", status.receipt_number)
-                        st.metric("Form", status.form_type)
-                    with col2:
-                        st.metric("Submitted", status.submitted_date or "N/A")
-                        st.metric("Modified", status.modified_date or "N/A")
-                    
-                    st.info(f"**{status.status_text_en}**")
-                    
-                except USCISApiError as e:
-                    st.session_state.traffic_stats["4xx"] += 1
-                    st.session_state.traffic_stats["total"] += 1
-                    add_log(f"Case: {receipt_input}", "ERROR", {"http": e.status})
-                    st.error(f"❌ HTTP {e.status}: {e}")
+                except uscis.USCISApiError as e:
+                    # INVALID_RECEIPT is rejected by the client before any request is sent
+                    sent = e.code != "INVALID_RECEIPT"
+                    if sent:
+                        st.session_state.traffic_stats.record(ok=False)
+                        add_log(f"Case: {receipt_input}", "ERROR", {"http": e.status})
+                    st.session_state.case_result = (None, f"HTTP {e.status}: {e}" if sent else str(e), False)
+            
+            if sent:
+                # Full rerun so the sidebar stats and the Logs tab show this lookup
+                st.rerun(scope="app")
+    
+    if st.session_state.get("case_result"):
+        _render_case_result(*st.session_state.case_result)
+
+
+with tab1:
+    _render_case_status_tab()
 
 
 # ==================== TAB 2: USCIS DEMO (SCREENSHOT THIS) ====================
 
-with tab2:
-    st.markdown("## 🎯 USCIS Production Access Demo")
-    st.markdown("**Screenshot this page for USCIS submission**")
+def _run_demo() -> dict:
+    """
+    Run the demo against a fresh client carrying the demo_id header
     
-    st.markdown("---")
+    Streams progress while it runs; returns the report _render_demo_report draws.
+    """
+    uscis = _uscis_module()
+    report = {"auth_error": None}
     
-    # Demo ID Box
+    demo_client = uscis.USCISApiClient(
+        client_id=DEFAULT_CLIENT_ID,
+        client_secret=DEFAULT_CLIENT_SECRET,
+        environment=uscis.USCISEnvironment.SANDBOX,
+        demo_id=DEMO_ID  # ← USCIS Demo ID Header
+    )
+    try:
+        with st.status("Authenticating...", expanded=True) as step:
+            demo_client.authenticate()
+            report["headers"] = demo_client.get_request_headers()
+            step.update(label="Authentication successful", state="complete")
+        
+        # st.status streams each response as it lands; spacing between
+        # requests comes from the rate limiter, not sleeps on this thread
+        with st.status("Testing 200 OK responses...", expanded=True) as step:
+            results, report["success_messages"] = run_test_batch(demo_client, VALID_RECEIPTS, expect_error=False)
+            
+            # Column-wise results (one list per field) feed the DataFrame directly
+            report["success_table"] = {
+                "Receipt": list(VALID_RECEIPTS),
+                "HTTP": [f"{e.status} ❌" if e else "200 ✅" for _, e in results],
+                "Form": [status.form_type if status else "N/A" for status, _ in results],
+                "Status": [str(e)[:30] if e else "Success" for _, e in results]
+            }
+            step.update(label="200 OK tests complete", state="complete")
+        
+        receipts, descriptions = zip(*DEMO_ERROR_CASES)
+        
+        with st.status("Testing 4xx error responses...", expanded=True) as step:
+            results, report["error_messages"] = run_test_batch(demo_client, receipts, expect_error=True)
+            
+            report["error_table"] = {
+                "Input": list(receipts),
+                "HTTP": [f"{e.status} ✅" if e else "200 ⚠️" for _, e in results],
+                "Expected": ["4xx"] * len(receipts),
+                "Description": list(descriptions)
+            }
+            step.update(label="4xx error tests complete", state="complete")
+        
+        report["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        report["celebrate"] = True
+        
+    except uscis.USCISApiError as e:
+        report["auth_error"] = str(e)
+    finally:
+        # The demo client is per run; don't leave its sockets to the GC
+        demo_client.close()
+    
+    return report
+
+
+def _render_demo_report(report: dict):
+    # Create client with demo_id
+    st.markdown("### Step 1: Initialize Client with demo_id")
+    st.code(f"""
+client = USCISApiClient(
+    client_id="***",
+    client_secret="***",
+    environment=USCISEnvironment.SANDBOX,
+    demo_id="{DEMO_ID}"  # ← USCIS Demo ID
+)
+    """, language="python")
+    st.success(f"✅ Client initialized with demo_id: {DEMO_ID}")
+    
+    # Authenticate
+    st.markdown("### Step 2: Authenticate")
+    if report["auth_error"]:
+        st.error(f"❌ Authentication failed: {report['auth_error']}")
+        return
+    st.success("✅ Authentication successful")
+    
+    # Show headers
+    st.markdown("### Step 3: Verify Headers")
+    st.markdown("\n\n".join(
+        f"**{k}: {v}** ← USCIS DEMO ID" if k == "demo_id" else f"{k}: {v}"
+        for k, v in report["headers"].items()
+    ))
+    
+    # Test 200 responses
+    st.markdown("### Step 4: Test 200 OK Responses")
+    with st.status("200 OK tests complete", state="complete", expanded=True):
+        show_messages(report["success_messages"])
+        st.dataframe(pd.DataFrame(report["success_table"]), hide_index=True)
+    
+    # Test 4xx responses
+    st.markdown("### Step 5: Test 4xx Error Responses")
+    with st.status("4xx error tests complete", state="complete", expanded=True):
+        show_messages(report["error_messages"])
+        st.dataframe(pd.DataFrame(report["error_table"]), hide_index=True)
+    
+    # Summary
+    st.markdown("### 📊 Demo Summary")
     st.markdown(f"""
     <div class="demo-box">
-        <h3>📋 Demo Configuration</h3>
+        <h4>✅ DEMO COMPLETE</h4>
         <p><strong>Demo ID:</strong> {DEMO_ID}</p>
-        <p><strong>Environment:</strong> Sandbox (api-int.uscis.gov)</p>
-        <p><strong>Timestamp:</strong> {datetime.now().isoformat()}</p>
+        <p><strong>200 OK Responses:</strong> {len(VALID_RECEIPTS)}</p>
+        <p><strong>4xx Error Responses:</strong> {len(DEMO_ERROR_CASES)}</p>
+        <p><strong>Total API Requests:</strong> {len(VALID_RECEIPTS) + len(DEMO_ERROR_CASES)}</p>
+        <p><strong>Timestamp:</strong> {report["finished_at"]}</p>
     </div>
     """, unsafe_allow_html=True)
     
+    # Only on the first draw after the run, not on every later rerun
+    if report.pop("celebrate", False):
+        st.balloons()
+
+
+@st.fragment
+def _render_demo_tab():
+    # One timestamp per render pass (a module-level value would go stale on fragment reruns)
+    rendered_at = datetime.now().isoformat(timespec="seconds")
+    
+    st.markdown("## 🎯 USCIS Production Access Demo")
+    st.markdown("**Screenshot this page for USCIS submission**")
+    
+    st.markdown("---")
+    
+    # Demo ID Box
+    st.markdown(
+        DEMO_BOX_TEMPLATE.format(timestamp=rendered_at),
+        unsafe_allow_html=True
+    )
+    
     # Request Headers
     st.markdown("### 📤 Request Headers")
-    st.markdown(f"""
-    <div class="header-box">
-Content-Type: application/json<br>
-Accept: application/json<br>
-<span style="color: #ffff00; font-weight: bold;">demo_id: {DEMO_ID}</span>  ← USCIS REQUIRED HEADER<br>
-Authorization: Bearer &lt;token&gt;
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_BOX_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -257,132 +662,23 @@ Authorization: Bearer &lt;token&gt;
         if not DEFAULT_CLIENT_ID or not DEFAULT_CLIENT_SECRET:
             st.error("❌ Missing credentials in secrets")
         else:
-            # Create client with demo_id
-            st.markdown("### Step 1: Initialize Client with demo_id")
-            
-            demo_client = USCISApiClient(
-                client_id=DEFAULT_CLIENT_ID,
-                client_secret=DEFAULT_CLIENT_SECRET,
-                environment=USCISEnvironment.SANDBOX,
-                demo_id=DEMO_ID  # ← USCIS Demo ID Header
-            )
-            
-            st.code(f"""
-client = USCISApiClient(
-    client_id="***",
-    client_secret="***",
-    environment=USCISEnvironment.SANDBOX,
-    demo_id="{DEMO_ID}"  # ← USCIS Demo ID
-)
-            """, language="python")
-            
-            st.success(f"✅ Client initialized with demo_id: {DEMO_ID}")
-            
-            # Authenticate
-            st.markdown("### Step 2: Authenticate")
-            try:
-                demo_client.authenticate()
-                st.success("✅ Authentication successful")
-                
-                # Show headers
-                st.markdown("### Step 3: Verify Headers")
-                headers = demo_client.get_request_headers()
-                
-                header_display = ""
-                for k, v in headers.items():
-                    if k == "demo_id":
-                        header_display += f"**{k}: {v}** ← USCIS DEMO ID\n\n"
-                    else:
-                        header_display += f"{k}: {v}\n\n"
-                
-                st.markdown(header_display)
-                
-                # Test 200 responses
-                st.markdown("### Step 4: Test 200 OK Responses")
-                
-                valid_receipts = ["EAC9999103402", "WAC9999103402", "LIN9999103402"]
-                results_200 = []
-                
-                progress = st.progress(0)
-                for i, receipt in enumerate(valid_receipts):
-                    try:
-                        status = demo_client.get_case_status(receipt)
-                        results_200.append({
-                            "Receipt": receipt,
-                            "HTTP": "200 ✅",
-                            "Form": status.form_type,
-                            "Status": "Success"
-                        })
-                        st.session_state.traffic_stats["200"] += 1
-                        st.session_state.traffic_stats["total"] += 1
-                    except USCISApiError as e:
-                        results_200.append({
-                            "Receipt": receipt,
-                            "HTTP": f"{e.status} ❌",
-                            "Form": "N/A",
-                            "Status": str(e)[:30]
-                        })
-                    progress.progress((i + 1) / len(valid_receipts))
-                    time.sleep(0.5)
-                
-                st.table(results_200)
-                
-                # Test 4xx responses
-                st.markdown("### Step 5: Test 4xx Error Responses")
-                
-                invalid_receipts = [
-                    ("INVALID", "Invalid format"),
-                    ("XXX0000000000", "Invalid prefix"),
-                    ("ABC", "Too short"),
-                ]
-                results_4xx = []
-                
-                progress2 = st.progress(0)
-                for i, (receipt, desc) in enumerate(invalid_receipts):
-                    try:
-                        demo_client.get_case_status(receipt)
-                        results_4xx.append({
-                            "Input": receipt,
-                            "HTTP": "200 ⚠️",
-                            "Expected": "4xx",
-                            "Description": desc
-                        })
-                    except USCISApiError as e:
-                        results_4xx.append({
-                            "Input": receipt,
-                            "HTTP": f"{e.status} ✅",
-                            "Expected": "4xx",
-                            "Description": desc
-                        })
-                        st.session_state.traffic_stats["4xx"] += 1
-                        st.session_state.traffic_stats["total"] += 1
-                    progress2.progress((i + 1) / len(invalid_receipts))
-                    time.sleep(0.5)
-                
-                st.table(results_4xx)
-                
-                # Summary
-                st.markdown("### 📊 Demo Summary")
-                st.markdown(f"""
-                <div class="demo-box">
-                    <h4>✅ DEMO COMPLETE</h4>
-                    <p><strong>Demo ID:</strong> {DEMO_ID}</p>
-                    <p><strong>200 OK Responses:</strong> {len(valid_receipts)}</p>
-                    <p><strong>4xx Error Responses:</strong> {len(invalid_receipts)}</p>
-                    <p><strong>Total API Requests:</strong> {len(valid_receipts) + len(invalid_receipts)}</p>
-                    <p><strong>Timestamp:</strong> {datetime.now().isoformat()}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.balloons()
-                
-            except USCISApiError as e:
-                st.error(f"❌ Authentication failed: {e}")
+            st.session_state.demo_report = _run_demo()
+            # Full rerun so the sidebar session stats pick up the demo's requests;
+            # the report is drawn from session state below
+            st.rerun(scope="app")
+    
+    if st.session_state.get("demo_report"):
+        _render_demo_report(st.session_state.demo_report)
+
+
+with tab2:
+    _render_demo_tab()
 
 
 # ==================== TAB 3: TRAFFIC TEST ====================
 
-with tab3:
+@st.fragment
+def _render_traffic_tab():
     st.markdown("## 🚀 Traffic Generator")
     st.markdown(f"**Demo ID: {DEMO_ID}** - All requests include demo_id header")
     
@@ -391,30 +687,25 @@ with tab3:
     # Quick Tests
     col1, col2 = st.columns(2)
     
+    # Each quick test stores its messages and does a full rerun so the sidebar
+    # session stats pick up the new counts; the messages are replayed from state
     with col1:
         st.markdown("### ✅ 200 OK Tests")
         if st.button("Run 3 Success Tests", disabled=not st.session_state.client):
-            for receipt in ["EAC9999103402", "WAC9999103402", "LIN9999103402"]:
-                try:
-                    st.session_state.client.get_case_status(receipt)
-                    st.session_state.traffic_stats["200"] += 1
-                    st.session_state.traffic_stats["total"] += 1
-                    st.success(f"✅ {receipt} - 200 OK")
-                except USCISApiError as e:
-                    st.error(f"❌ {receipt} - {e.status}")
-                time.sleep(0.5)
+            _, st.session_state.quick_success_messages = run_test_batch(
+                st.session_state.client, VALID_RECEIPTS, expect_error=False
+            )
+            st.rerun(scope="app")
+        show_messages(st.session_state.get("quick_success_messages", ()))
     
     with col2:
         st.markdown("### ❌ 4xx Error Tests")
         if st.button("Run 3 Error Tests", disabled=not st.session_state.client):
-            for receipt in ["INVALID", "XXX000", "ABC"]:
-                try:
-                    st.session_state.client.get_case_status(receipt)
-                except USCISApiError as e:
-                    st.session_state.traffic_stats["4xx"] += 1
-                    st.session_state.traffic_stats["total"] += 1
-                    st.success(f"✅ {receipt} - {e.status} (expected)")
-                time.sleep(0.5)
+            _, st.session_state.quick_error_messages = run_test_batch(
+                st.session_state.client, ERROR_RECEIPTS[:3], expect_error=True
+            )
+            st.rerun(scope="app")
+        show_messages(st.session_state.get("quick_error_messages", ()))
     
     st.markdown("---")
     
@@ -438,85 +729,114 @@ with tab3:
         results_200 = 0
         results_4xx = 0
         
-        # Success requests
-        valid_receipts = ["EAC9999103402", "WAC9999103402", "LIN9999103402"]
-        for i in range(num_success):
-            receipt = valid_receipts[i % len(valid_receipts)]
-            status.info(f"[{i+1}/{total}] Testing 200: {receipt}")
-            try:
-                st.session_state.client.get_case_status(receipt)
-                st.session_state.traffic_stats["200"] += 1
-                st.session_state.traffic_stats["total"] += 1
+        # Build the full request plan up front: success receipts, then error receipts
+        receipts = [*islice(cycle(VALID_RECEIPTS), num_success), *islice(cycle(ERROR_RECEIPTS), num_errors)]
+        
+        # Count locally and repaint at most every UI_FLUSH_INTERVAL seconds;
+        # the final result is always painted
+        last_flush = time.monotonic()
+        completed = iter_case_statuses(st.session_state.client, receipts, min_interval=delay)
+        for done, (_, receipt, _, e) in enumerate(completed, start=1):
+            if e is None:
                 results_200 += 1
-            except USCISApiError as e:
+            elif _is_4xx(e.status):
+                results_4xx += 1
+            else:
                 status.warning(f"Request failed: {e}")
-            progress.progress((i + 1) / total)
-            time.sleep(delay)
+            
+            now = time.monotonic()
+            if now - last_flush > UI_FLUSH_INTERVAL or done == total:
+                progress.progress(done / total)
+                status.info(f"[{done}/{total}] Completed: {receipt}")
+                last_flush = now
         
-        # Error requests
-        error_receipts = ["INVALID", "XXX000", "ABC", "123", "!@#"]
-        for i in range(num_errors):
-            receipt = error_receipts[i % len(error_receipts)]
-            status.info(f"[{num_success + i + 1}/{total}] Testing 4xx: {receipt}")
-            try:
-                st.session_state.client.get_case_status(receipt)
-            except USCISApiError as e:
-                if str(e.status).startswith("4"):
-                    st.session_state.traffic_stats["4xx"] += 1
-                    st.session_state.traffic_stats["total"] += 1
-                    results_4xx += 1
-            progress.progress((num_success + i + 1) / total)
-            time.sleep(delay)
+        st.session_state.traffic_stats.ok += results_200
+        st.session_state.traffic_stats.err += results_4xx
         
         status.empty()
-        st.success(f"""
+        st.session_state.bulk_summary = f"""
         ✅ **Bulk Traffic Complete!**
         - Demo ID: {DEMO_ID}
         - 200 OK responses: {results_200}
         - 4xx error responses: {results_4xx}
         - Total requests: {results_200 + results_4xx}
-        """)
+        """
+        # Full rerun so the sidebar session stats pick up the new counts
+        st.rerun(scope="app")
+    
+    if st.session_state.get("bulk_summary"):
+        st.success(st.session_state.bulk_summary)
+
+
+with tab3:
+    _render_traffic_tab()
 
 
 # ==================== TAB 4: CONNECTION ====================
 
-with tab4:
+@st.fragment
+def _render_connection_tab():
     st.markdown("## 🧪 Connection Test")
     
     if st.session_state.client:
-        st.info(f"**Environment:** {st.session_state.client.environment.value.upper()}")
-        st.info(f"**Demo ID:** {DEMO_ID}")
-        st.info(f"**Base URL:** {st.session_state.client.base_url}")
+        st.info(
+            f"**Environment:** {st.session_state.client.environment.value.upper()}\n\n"
+            f"**Demo ID:** {DEMO_ID}\n\n"
+            f"**Base URL:** {st.session_state.client.base_url}"
+        )
         
         st.markdown("### Request Headers")
         if st.session_state.client.is_authenticated:
             headers = st.session_state.client.get_request_headers()
-            st.json(headers)
+            st.code(json.dumps(headers, indent=2), language="json")
     
     if st.button("🧪 Test Connection"):
         if st.session_state.client:
             results = st.session_state.client.test_connection()
-            st.json(results)
+            st.code(json.dumps(results, indent=2, default=str), language="json")
+
+
+with tab4:
+    _render_connection_tab()
 
 
 # ==================== TAB 5: LOGS ====================
 
-with tab5:
+@st.fragment
+def _render_logs_tab():
     st.markdown("## 📜 API Logs")
     
     if st.button("Clear Logs"):
-        st.session_state.api_logs = []
-        st.session_state.traffic_stats = {"200": 0, "4xx": 0, "total": 0}
+        st.session_state.api_logs.clear()
+        st.session_state.traffic_stats = TrafficStats()
         st.rerun()
     
     if st.session_state.api_logs:
-        for log in st.session_state.api_logs[:20]:
-            icon = "✅" if log["status"] == "SUCCESS" else "❌"
-            st.text(f"{icon} {log['timestamp'][:19]} | {log['action']}")
+        # One table element for the whole buffer, with columns filled in one pass
+        columns = {"Timestamp": [], "Status": [], "Action": [], "Details": []}
+        for log in st.session_state.api_logs:
+            columns["Timestamp"].append(log.ts)
+            columns["Status"].append(f"{'✅' if log.status == 'SUCCESS' else '❌'} {log.status}")
+            columns["Action"].append(log.action)
+            columns["Details"].append(log.details_json)
+        st.dataframe(pd.DataFrame(columns), hide_index=True, width="stretch")
+
+        # Full details for a single entry, on demand
+        logs = st.session_state.api_logs
+        selected = st.selectbox(
+            "Inspect entry",
+            range(len(logs)),
+            format_func=lambda i: f"{logs[i].ts} | {logs[i].status} | {logs[i].action}"
+        )
+        st.code(logs[selected].details_json, language="json")
     else:
         st.info("No logs yet")
 
 
+with tab5:
+    _render_logs_tab()
+
+
 # ==================== FOOTER ====================
 
 st.markdown("---")
@@ -12,23 +12,58 @@ Authentication: OAuth 2.0 Client Credentials
 DEMO ID: 3401 (Required for production access demo)
 """
 
+import hashlib
+import json
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
+# orjson is optional; it decodes responses noticeably faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Tokens shared by every client in the process, keyed by (client_id, SHA-256 of
+# the secret, environment): only a client holding the same secret may reuse a
+# token, and the plaintext secret never lands in the shared dict.
+_TOKEN_CACHE: Dict[tuple, "TokenInfo"] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+# Receipt numbers are a three-letter service center code followed by 10 digits
+_RECEIPT_RE = re.compile(r"^(EAC|WAC|LIN|SRC|MSC|NBC|YSC|IOE)\d{10}$", re.IGNORECASE)
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body straight from bytes, via orjson when available"""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a JSON request body to bytes, via orjson when available"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj, separators=(",", ":")).encode()
+
 
 class USCISEnvironment(Enum):
     SANDBOX = "sandbox"
     PRODUCTION = "production"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
     """OAuth 2.0 Access Token Information"""
     access_token: str
@@ -36,18 +71,24 @@ class TokenInfo:
     expires_in: int
     issued_at: datetime
     api_products: List[str] = field(default_factory=list)
+    # Monotonic clock reading at issue; expiry checks use this, issued_at is for display
+    issued_monotonic: float = field(default_factory=time.monotonic)
     
     @property
     def expires_at(self) -> datetime:
         return self.issued_at + timedelta(seconds=self.expires_in)
     
+    @property
+    def seconds_remaining(self) -> float:
+        return self.issued_monotonic + self.expires_in - time.monotonic()
+    
     @property
     def is_expired(self) -> bool:
         # Add 60 second buffer before expiration
-        return datetime.now() >= (self.expires_at - timedelta(seconds=60))
+        return self.seconds_remaining <= 60
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseStatus:
     """Case Status API Response"""
     receipt_number: str
@@ -59,16 +100,16 @@ class CaseStatus:
     status_text_es: Optional[str] = None
     status_desc_es: Optional[str] = None
     history: Optional[List[Dict]] = None
-    raw_response: Dict = field(default_factory=dict)
+    raw_response: Dict = field(default_factory=dict, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class FOIARequest:
     """FOIA Request Data"""
     request_number: Optional[str] = None
     status: Optional[str] = None
     created_date: Optional[str] = None
-    raw_response: Dict = field(default_factory=dict)
+    raw_response: Dict = field(default_factory=dict, repr=False)
 
 
 class USCISApiError(Exception):
@@ -80,6 +121,19 @@ class USCISApiError(Exception):
         self.trace_id = trace_id
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, raising USCISApiError when it isn't JSON"""
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        # orjson/json raise plain ValueErrors, which requests' own handling won't catch
+        raise USCISApiError(
+            message=f"Invalid JSON in API response ({response.status_code}): {e}",
+            code="INVALID_RESPONSE",
+            status=response.status_code
+        ) from e
+
+
 class USCISApiClient:
     """
     USCIS Torch API Client
@@ -87,9 +141,9 @@ class USCISApiClient:
     Official documentation: https://developer.uscis.gov
     
     Usage:
-        client = USCISApiClient(client_id="xxx", client_secret="xxx")
-        client.authenticate()
-        status = client.get_case_status("EAC9999103402")
+        with USCISApiClient(client_id="xxx", client_secret="xxx") as client:
+            client.authenticate()
+            status = client.get_case_status("EAC9999103402")
     """
     
     # API Endpoints from official documentation
@@ -111,12 +165,20 @@ class USCISApiClient:
         "LIN9999103402",  # Test receipt
     ]
     
+    # Concurrent requests per get_case_status_batch call
+    BATCH_MAX_WORKERS = 10
+    
+    # Parsed case statuses are reused for this many seconds, up to this many receipts
+    CASE_CACHE_TTL = 60
+    CASE_CACHE_MAXSIZE = 1024
+    
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         environment: USCISEnvironment = USCISEnvironment.SANDBOX,
-        demo_id: Optional[str] = None
+        demo_id: Optional[str] = None,
+        keep_raw: bool = False
     ):
         """
         Initialize USCIS API Client
@@ -126,16 +188,63 @@ class USCISApiClient:
             client_secret: OAuth Client Secret from Developer Portal
             environment: SANDBOX or PRODUCTION
             demo_id: Demo ID provided by USCIS for production access testing
+            keep_raw: Keep the full JSON payload on results as raw_response
+                (default: False, leaving raw_response empty)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.environment = environment
         self.demo_id = demo_id
+        self._keep_raw = keep_raw
         self.token_info: Optional[TokenInfo] = None
+        # Monotonic deadline (60s buffer included) for the current token, so the
+        # per-request check is a single float comparison
+        self._token_expires_mono = 0.0
+        
+        # Serializes token refreshes so concurrent callers share one OAuth call
+        self._auth_lock = threading.Lock()
+        
+        # Tokens this close to expiry are renewed in the background, off the request path
+        self._refresh_threshold = timedelta(minutes=5)
+        self._refreshing = threading.Event()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        
+        # receipt -> (time.monotonic() when fetched, CaseStatus), oldest first
+        self._case_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._case_cache_lock = threading.Lock()
+        
+        # receipt -> Future of the lookup currently on the wire, shared by
+        # concurrent cached callers asking for the same receipt
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
         
         self._endpoints = self.ENDPOINTS[environment]
+        
+        # Full endpoint URLs, built once instead of per request
+        base_url = self._endpoints["base_url"]
+        self._case_status_prefix = base_url + "/case-status/"
+        self._foia_request_url = base_url + "/foia/request"
+        self._foia_status_prefix = base_url + "/foia/status/"
+        
         self._session = requests.Session()
         
+        # Keep-alive pool shared by all calls (including concurrent ones) to the
+        # single USCIS host, with backoff retries on transient errors. Only
+        # idempotent methods are retried, so FOIA POSTs are never resent.
+        # Backoff is jittered so concurrent callers don't retry in lockstep, and
+        # a Retry-After from a 429/503 takes precedence over it.
+        # raise_on_status=False hands the final error response back to us so
+        # it still surfaces as a USCISApiError with its HTTP status.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            backoff_jitter=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=20, max_retries=retry))
+        
         # Setup default headers
         default_headers = {
             "Content-Type": "application/json",
@@ -146,9 +255,28 @@ class USCISApiClient:
         # USCIS Demo ID: 3401
         if demo_id:
             default_headers["demo_id"] = demo_id
-            logger.info(f"Demo ID header set: {demo_id}")
+            logger.info("Demo ID header set: %s", demo_id)
         
         self._session.headers.update(default_headers)
+        
+        # Pick up a still-valid token issued to another client with the same credentials
+        self._token_cache_key = (
+            client_id,
+            hashlib.sha256(client_secret.encode("utf-8")).hexdigest(),
+            environment
+        )
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(self._token_cache_key)
+        if cached and not cached.is_expired:
+            self._set_token(cached)
+    
+    def _set_token(self, token_info: "TokenInfo"):
+        """Install a token on this client and its session"""
+        self.token_info = token_info
+        self._token_expires_mono = token_info.issued_monotonic + token_info.expires_in - 60
+        self._session.headers.update({
+            "Authorization": f"Bearer {token_info.access_token}"
+        })
     
     @property
     def base_url(self) -> str:
@@ -160,7 +288,14 @@ class USCISApiClient:
     
     @property
     def is_authenticated(self) -> bool:
-        return self.token_info is not None and not self.token_info.is_expired
+        return time.monotonic() < self._token_expires_mono
+    
+    @property
+    def is_near_expiry(self) -> bool:
+        return (
+            self.token_info is not None
+            and self.token_info.seconds_remaining < self._refresh_threshold.total_seconds()
+        )
     
     def authenticate(self) -> TokenInfo:
         """
@@ -169,12 +304,16 @@ class USCISApiClient:
         Returns:
             TokenInfo object with access token details
         """
-        logger.info(f"Authenticating with USCIS {self.environment.value} environment")
+        logger.info("Authenticating with USCIS %s environment", self.environment.value)
         
         try:
-            response = requests.post(
+            # Reuse the pooled session; drop any stale bearer token for this call
+            response = self._session.post(
                 self.oauth_url,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "Authorization": None
+                },
                 data={
                     "grant_type": "client_credentials",
                     "client_id": self.client_id,
@@ -184,21 +323,26 @@ class USCISApiClient:
             )
             
             if response.status_code != 200:
-                error_data = response.json() if response.text else {}
+                # Error bodies may be HTML (e.g. a 503 outside sandbox hours)
+                error_data = {}
+                try:
+                    error_data = _json_loads(response.content) if response.content else {}
+                except ValueError:
+                    pass
                 raise USCISApiError(
                     message=f"Authentication failed: {response.status_code}",
                     code=error_data.get("error", "AUTH_ERROR"),
                     status=response.status_code
                 )
             
-            data = response.json()
+            data = _decode_json(response)
             
             # Parse API products list
             api_products = data.get("api_product_list_json", [])
             if isinstance(api_products, str):
                 api_products = [api_products]
             
-            self.token_info = TokenInfo(
+            token_info = TokenInfo(
                 access_token=data["access_token"],
                 token_type=data.get("token_type", "Bearer"),
                 expires_in=int(data.get("expires_in", 1799)),
@@ -206,13 +350,13 @@ class USCISApiClient:
                 api_products=api_products
             )
             
-            # Update session with bearer token
-            self._session.headers.update({
-                "Authorization": f"Bearer {self.token_info.access_token}"
-            })
+            # Update session with bearer token and share it process-wide
+            self._set_token(token_info)
+            with _TOKEN_CACHE_LOCK:
+                _TOKEN_CACHE[self._token_cache_key] = token_info
             
-            logger.info(f"Authentication successful. Token expires in {self.token_info.expires_in}s")
-            logger.info(f"API Products: {api_products}")
+            logger.info("Authentication successful. Token expires in %ss", self.token_info.expires_in)
+            logger.info("API Products: %s", api_products)
             
             return self.token_info
             
@@ -221,44 +365,97 @@ class USCISApiClient:
     
     def _ensure_authenticated(self):
         """Ensure we have a valid access token"""
-        if not self.is_authenticated:
-            self.authenticate()
+        # Fast path without the lock; re-check once holding it, since another
+        # thread may have refreshed the token while we waited
+        if time.monotonic() < self._token_expires_mono:
+            return
+        with self._auth_lock:
+            if time.monotonic() >= self._token_expires_mono:
+                self.authenticate()
+    
+    def _discard_token(self, token_info: Optional[TokenInfo]):
+        """Forget a token the API rejected, unless another thread already replaced it"""
+        with self._auth_lock:
+            if self.token_info is token_info:
+                self.token_info = None
+                self._token_expires_mono = 0.0
+        with _TOKEN_CACHE_LOCK:
+            if _TOKEN_CACHE.get(self._token_cache_key) is token_info:
+                del _TOKEN_CACHE[self._token_cache_key]
     
-    def _make_request(
+    def _schedule_token_refresh(self):
+        """Renew a near-expiry token on a background thread, at most one at a time"""
+        if not self.is_near_expiry or self._refreshing.is_set():
+            return
+        self._refreshing.set()
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="uscis-token-refresh"
+            )
+        self._refresh_executor.submit(self._background_refresh)
+    
+    def _background_refresh(self):
+        try:
+            with self._auth_lock:
+                if self.is_near_expiry:
+                    self.authenticate()
+        except USCISApiError as e:
+            # The next request falls back to a synchronous refresh once expired
+            logger.warning("Background token refresh failed: %s", e)
+        finally:
+            self._refreshing.clear()
+    
+    def _make_request_url(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         params: Dict = None,
-        json_data: Dict = None
+        json_data: Dict = None,
+        retry_auth: bool = True
     ) -> Dict:
-        """Make authenticated API request"""
+        """Make authenticated API request to a full URL"""
         self._ensure_authenticated()
+        token_info = self.token_info
         
-        url = f"{self.base_url}{endpoint}"
-        
-        logger.info(f"Making {method} request to: {url}")
+        logger.info("Making %s request to: %s", method, url)
         if self.demo_id:
-            logger.info(f"Using demo_id: {self.demo_id}")
+            logger.info("Using demo_id: %s", self.demo_id)
+        
+        # Encoded here rather than via requests' json=; the session already sends
+        # Content-Type: application/json
+        body = _json_dumps(json_data) if json_data is not None else None
         
         try:
             response = self._session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json_data,
+                data=body,
                 timeout=30
             )
             
-            logger.info(f"Response status: {response.status_code}")
+            logger.info("Response status: %s", response.status_code)
+            
+            # A rejected token (revoked, or expired early server-side) gets one
+            # fresh token and one retry before surfacing as an error
+            if response.status_code == 401 and retry_auth:
+                self._discard_token(token_info)
+                return self._make_request_url(method, url, params, json_data, retry_auth=False)
             
             # Handle errors
             if response.status_code >= 400:
+                # Only the start of the body is ever shown, so decode just that much
+                # (a 503 can come back as a large HTML page)
+                error_body = response.content[:1024].decode("utf-8", "replace")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Error response body: %s", response.text)
+                
                 # Try to parse error response
-                error_body = response.text
                 error_data = {}
                 try:
-                    error_data = response.json() if response.text else {}
-                except:
+                    error_data = _json_loads(response.content) if response.content else {}
+                except ValueError:
+                    # Not JSON (orjson's and json's decode errors are both ValueErrors)
                     pass
                 
                 errors = error_data.get("errors", [{}])
@@ -269,8 +466,8 @@ class USCISApiClient:
                 
                 # If no message from API, create user-friendly messages
                 if not error_msg:
-                    # Extract receipt/id from endpoint
-                    receipt = endpoint.split("/")[-1] if "/" in endpoint else "unknown"
+                    # Extract receipt/id from the URL
+                    receipt = url.rsplit("/", 1)[-1]
                     
                     if response.status_code == 400:
                         error_msg = f"Invalid receipt number format: {receipt}"
@@ -292,14 +489,20 @@ class USCISApiClient:
                     trace_id=first_error.get("traceId")
                 )
             
-            return response.json()
+            self._schedule_token_refresh()
+            return _decode_json(response)
             
         except requests.RequestException as e:
             raise USCISApiError(f"Network error: {str(e)}")
     
     # ==================== CASE STATUS API ====================
     
-    def get_case_status(self, receipt_number: str) -> CaseStatus:
+    def get_case_status(
+        self,
+        receipt_number: str,
+        use_cache: bool = True,
+        validate: bool = True
+    ) -> CaseStatus:
         """
         Get case status by receipt number
         
@@ -307,20 +510,64 @@ class USCISApiClient:
         
         Args:
             receipt_number: USCIS receipt number (e.g., EAC9999103402)
+            use_cache: Return a result fetched within CASE_CACHE_TTL seconds
+                instead of calling the API (default: True)
+            validate: Reject malformed receipt numbers locally, without an
+                API call (default: True)
         
         Returns:
             CaseStatus object with case details
         """
-        logger.info(f"Getting case status for: {receipt_number}")
+        logger.info("Getting case status for: %s", receipt_number)
         
         # Clean the receipt number
         receipt_number = receipt_number.strip()
         
-        data = self._make_request("GET", f"/case-status/{receipt_number}")
+        if validate and not _RECEIPT_RE.match(receipt_number):
+            raise USCISApiError(
+                message=f"Invalid receipt number format: {receipt_number}",
+                code="INVALID_RECEIPT"
+            )
+        
+        if use_cache:
+            with self._case_cache_lock:
+                hit = self._case_cache.get(receipt_number)
+                # A result cached without its payload can't serve a keep_raw lookup
+                if (hit and time.monotonic() - hit[0] < self.CASE_CACHE_TTL
+                        and (hit[1].raw_response or not self._keep_raw)):
+                    self._case_cache.move_to_end(receipt_number)
+                    return hit[1]
+            
+            # Join a lookup for the same receipt that is already in flight
+            with self._inflight_lock:
+                future = self._inflight.get(receipt_number)
+                owner = future is None
+                if owner:
+                    future = self._inflight[receipt_number] = Future()
+            if not owner:
+                return future.result()
+            
+            try:
+                result = self._fetch_case_status(receipt_number)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[receipt_number]
+        
+        return self._fetch_case_status(receipt_number)
+    
+    def _fetch_case_status(self, receipt_number: str) -> CaseStatus:
+        """Call the Case Status API, parse the result and cache it"""
+        data = self._make_request_url("GET", self._case_status_prefix + receipt_number)
         
         case_data = data.get("case_status", {})
         
-        return CaseStatus(
+        result = CaseStatus(
             receipt_number=case_data.get("receiptNumber", receipt_number),
             form_type=case_data.get("formType", ""),
             submitted_date=case_data.get("submittedDate"),
@@ -330,8 +577,21 @@ class USCISApiClient:
             status_text_es=case_data.get("current_case_status_text_es"),
             status_desc_es=case_data.get("current_case_status_desc_es"),
             history=case_data.get("hist_case_status"),
-            raw_response=data
+            raw_response=data if self._keep_raw else {}
         )
+        
+        with self._case_cache_lock:
+            self._case_cache[receipt_number] = (time.monotonic(), result)
+            self._case_cache.move_to_end(receipt_number)
+            if len(self._case_cache) > self.CASE_CACHE_MAXSIZE:
+                self._case_cache.popitem(last=False)
+        
+        return result
+    
+    def invalidate(self, receipt_number: str):
+        """Drop a cached case status so the next lookup goes to the API"""
+        with self._case_cache_lock:
+            self._case_cache.pop(receipt_number.strip(), None)
     
     def get_case_status_batch(self, receipt_numbers: List[str]) -> Dict[str, CaseStatus]:
         """
@@ -346,17 +606,38 @@ class USCISApiClient:
         results = {}
         errors = {}
         
-        for receipt in receipt_numbers:
-            try:
-                results[receipt] = self.get_case_status(receipt)
-            except USCISApiError as e:
-                errors[receipt] = str(e)
-                logger.error(f"Error getting status for {receipt}: {e}")
+        # Each distinct receipt is fetched once (dict.fromkeys keeps input order);
+        # malformed receipts are reported without going to the API
+        valid = []
+        for receipt in dict.fromkeys(receipt_numbers):
+            if _RECEIPT_RE.match(receipt.strip()):
+                valid.append(receipt)
+            else:
+                errors[receipt] = f"Invalid receipt number format: {receipt}"
+        
+        if valid:
+            # Authenticate once up front so the workers all take the fast path
+            self._ensure_authenticated()
+            
+            # Requests overlap on the session's keep-alive pool (pool_maxsize >= workers)
+            with ThreadPoolExecutor(max_workers=min(self.BATCH_MAX_WORKERS, len(valid))) as executor:
+                futures = {
+                    executor.submit(self.get_case_status, r, validate=False): r
+                    for r in valid
+                }
+                for future in as_completed(futures):
+                    receipt = futures[future]
+                    try:
+                        results[receipt] = future.result()
+                    except USCISApiError as e:
+                        errors[receipt] = str(e)
+                        logger.error("Error getting status for %s: %s", receipt, e)
         
         if errors:
-            logger.warning(f"Batch had {len(errors)} errors out of {len(receipt_numbers)} requests")
+            logger.warning("Batch had %d errors out of %d requests", len(errors), len(receipt_numbers))
         
-        return results
+        # Results arrive in completion order; hand them back in input order
+        return {r: results[r] for r in valid if r in results}
     
     # ==================== FOIA API ====================
     
@@ -388,7 +669,7 @@ class USCISApiClient:
         Returns:
             FOIARequest object with request number
         """
-        logger.info(f"Creating FOIA request for: {subject_first_name} {subject_last_name}")
+        logger.info("Creating FOIA request for: %s %s", subject_first_name, subject_last_name)
         
         payload = {
             "subjectFirstName": subject_first_name,
@@ -405,13 +686,13 @@ class USCISApiClient:
         
         payload.update(additional_fields)
         
-        data = self._make_request("POST", "/foia/request", json_data=payload)
+        data = self._make_request_url("POST", self._foia_request_url, json_data=payload)
         
         return FOIARequest(
             request_number=data.get("requestNumber"),
             status=data.get("status"),
             created_date=data.get("createdDate"),
-            raw_response=data
+            raw_response=data if self._keep_raw else {}
         )
     
     def get_foia_status(self, request_number: str) -> FOIARequest:
@@ -426,18 +707,48 @@ class USCISApiClient:
         Returns:
             FOIARequest object with status details
         """
-        logger.info(f"Getting FOIA status for: {request_number}")
+        logger.info("Getting FOIA status for: %s", request_number)
         
-        data = self._make_request("GET", f"/foia/status/{request_number}")
+        data = self._make_request_url("GET", self._foia_status_prefix + request_number)
         
         return FOIARequest(
             request_number=request_number,
             status=data.get("status"),
-            raw_response=data
+            raw_response=data if self._keep_raw else {}
         )
     
     # ==================== UTILITY METHODS ====================
     
+    def close(self):
+        """Release pooled connections and stop the background token refresher"""
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
+            self._refresh_executor = None
+        self._session.close()
+    
+    def __enter__(self) -> "USCISApiClient":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @contextmanager
+    def with_raw(self):
+        """
+        Keep raw_response on results fetched inside the block
+        
+        Usage:
+            with client.with_raw():
+                status = client.get_case_status("EAC9999103402")
+            print(status.raw_response)
+        """
+        previous = self._keep_raw
+        self._keep_raw = True
+        try:
+            yield self
+        finally:
+            self._keep_raw = previous
+    
     def get_token_info(self) -> Dict[str, Any]:
         """Get current token information"""
         if not self.token_info:
@@ -450,7 +761,7 @@ class USCISApiClient:
             "issued_at": self.token_info.issued_at.isoformat(),
             "expires_at": self.token_info.expires_at.isoformat(),
             "is_expired": self.token_info.is_expired,
-            "seconds_remaining": max(0, int((self.token_info.expires_at - datetime.now()).total_seconds())),
+            "seconds_remaining": max(0, int(self.token_info.seconds_remaining)),
             "api_products": self.token_info.api_products,
             "environment": self.environment.value,
             "demo_id": self.demo_id
@@ -498,7 +809,7 @@ class USCISApiClient:
         if self.environment == USCISEnvironment.SANDBOX:
             test_receipt = self.SANDBOX_TEST_RECEIPTS[0]
             try:
-                status = self.get_case_status(test_receipt)
+                status = self.get_case_status(test_receipt, use_cache=False)
                 results["case_status_api"] = {
                     "success": True,
                     "test_receipt": test_receipt,
@@ -550,6 +861,10 @@ def create_client(
     
     Returns:
         Authenticated USCISApiClient
+    
+    Usage:
+        with create_client(client_id, client_secret, demo_id="3401") as client:
+            status = client.get_case_status("EAC9999103402")
     """
     env = USCISEnvironment.SANDBOX if sandbox else USCISEnvironment.PRODUCTION
     client = USCISApiClient(client_id, client_secret, env, demo_id=demo_id)